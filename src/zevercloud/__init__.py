@@ -1,3 +1,4 @@
 from .cloud import ZeverCloud
+from .exceptions import ZeverCloudError
 
 __version__ = "0.2.1"
@@ -1,14 +1,104 @@
+from asyncio import gather
 from base64 import b64encode
-from datetime import datetime, date, time, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from hashlib import sha256
 from hmac import new as hmac
-from time import time as timestamp
-from typing import Any, Dict, List, Union
+from itertools import chain
+from logging import getLogger
+from time import monotonic, time as timestamp
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
 from uuid import uuid4
 
-from requests import get
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
 
+try:
+    from orjson import loads
+except ImportError:  # orjson is an optional dependency.
+    from json import loads
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, needed for the asynchronous methods.
+    aiohttp = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, needed for get_output_array.
+    np = None
+
+from zevercloud.detail import ZeverSolarDetail
 from zevercloud.event import ZeverSolarEvent
+from zevercloud.exceptions import ZeverCloudError
+
+logger = getLogger(__name__)
+
+# Maximum number of concurrent requests made by a single method call.
+_MAX_WORKERS = 8
+
+# The yield fields of the overview, by the key of their field in the response.
+_OVERVIEW_YIELDS = (("today", "E-Today"), ("month", "E-Month"), ("year", "E-Year"), ("total", "E-Total"))
+
+# The API returns events for at most 7 days (inclusive) at a time.
+_WEEK = timedelta(days=7)
+_SIX_DAYS = timedelta(days=6)
+
+# Formats a date as YYYY-MM-DD. Unlike datetime.isoformat, this also drops the time of a datetime.
+_format_date = date.isoformat
+
+# The (lowercase) units used by the API, with their multiplier relative to W or Wh and whether they are units of yield.
+_UNITS = {
+    "w": (1, False),
+    "kw": (1000, False),
+    "mw": (1_000_000, False),
+    "wh": (1, True),
+    "kwh": (1000, True),
+    "mwh": (1_000_000, True),
+}
+
+
+def _apply_unit(value: float, unit: str) -> Union[float, int]:
+    """
+    Given a unit and a value, convert the value to a standardized unit.
+
+    Values are converted to:
+    - W (Watt) for power (i.e. the incoming unit is W, kW, MW)
+    - kWh (kiloWatt-hour) for yield (i.e. the incoming unit is Wh, kWh, MWh)
+
+    When converting many values of the same unit, use _unit_converter instead.
+    """
+    return _unit_converter(unit)(value)
+
+
+@lru_cache(maxsize=32)
+def _unit_converter(unit: str) -> Callable[[Union[float, str]], Union[float, int]]:
+    """
+    Get a function that converts values of the given unit to a standardized unit (see _apply_unit).
+
+    The function also accepts the values as the numeric strings returned by the API.
+    The API only uses a handful of units, so the converters are cached.
+    """
+    multiplier, is_yield = _unit_scale(unit)
+    if is_yield:  # We convert yield to kWh
+        if multiplier == 1000:  # Already in kWh
+            return float
+        return lambda value: multiplier * float(value) / 1000
+    return lambda value: int(round(multiplier * float(value)))
+
+
+def _unit_scale(unit: str) -> Tuple[int, bool]:
+    """
+    Decode a unit into its multiplier relative to W or Wh, and whether it is a unit of yield.
+
+    As the Zevercloud API (sometimes) uses incorrect capitalisation (KWh instead of kWh),
+    capitalisation is ignored.
+    """
+    try:
+        return _UNITS[unit.lower()]
+    except KeyError:
+        raise ValueError(f"Unrecognized unit: {unit}") from None
 
 
 class ZeverCloud:
@@ -22,16 +112,67 @@ class ZeverCloud:
             Can be found under `Account Management > Security Settings`.
         app_secret (str): Your app secret.
             Can be found under `Account Management > Security Settings`.
+        https (bool): Connect to the API over HTTPS instead of plain HTTP. Defaults to False.
 
     Note that the app_key and app_secret are only visible once approved by Zeversolar Support.
     Send an email to service.eu@zeversolar.net, for example, and ask them to make the `app_key`
     and `app_secret` visible to you.
     """
 
-    def __init__(self, api_key: str, app_key: str, app_secret: str):
+    def __init__(self, api_key: str, app_key: str, app_secret: str, https: bool = False):
         self.api_key = api_key
         self.app_key = app_key
         self.app_secret = app_secret
+        # The key never changes, so the HMAC is keyed once and copied for every request.
+        self._hmac = hmac(key=app_secret.encode("UTF-8"), digestmod=sha256)
+        self._payload_prefix = f"GET\napplication/json\n\n\n\nX-Ca-Key:{app_key}\n".encode("UTF-8")
+        # The api key is part of every url, so the urls are templated once.
+        self._overview_url = f"/getPlantOverview?key={api_key}"
+        self._inverters_url = f"/getInverterOverview?key={api_key}"
+        self._total_output_url = f"/getPlantOutput?key={api_key}&period=bytotal"
+        # Braces in the api key must not be read as fields by str.format.
+        key = api_key.replace("{", "{{").replace("}", "}}")
+        self._output_url = f"/getPlantOutput?date={{}}&key={key}&period={{}}"
+        self._details_url = f"/getpmudata?apikey={key}&date={{}}&psno={{}}"
+        self._events_url = f"/getPlantEvent?edt={{}}&key={key}&sdt={{}}"
+        # Reuse the connections to the API across requests. Dropped keep-alive connections are retried.
+        pool_class = HTTPSConnectionPool if https else HTTPConnectionPool
+        self._pool = pool_class("api.general.zevercloud.cn", maxsize=_MAX_WORKERS, timeout=30)
+        # The asynchronous methods only share a session within `async with` (see _aget).
+        self._base_url = f"{'https' if https else 'http'}://api.general.zevercloud.cn"
+        self._asession = None
+        # Number of seconds for which the responses of these urls are cached. Other responses are not cached.
+        self._cache_ttl = {self._overview_url: 30, self._inverters_url: 30, self._total_output_url: 3600}
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def __enter__(self) -> "ZeverCloud":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ZeverCloud":
+        if aiohttp is not None:
+            self._asession = self._new_session()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the connection(s) to the API."""
+        self._pool.close()
+
+    async def aclose(self) -> None:
+        """Close the connection(s) to the API, including those of the asynchronous methods."""
+        if self._asession is not None:
+            await self._asession.close()
+            self._asession = None
+        self.close()
+
+    def refresh(self) -> None:
+        """Clear the cached responses, so that they are retrieved again on next access."""
+        self._cache.clear()
 
     @property
     def overview(self) -> Dict[str, Any]:
@@ -51,18 +192,17 @@ class ZeverCloud:
                 "year": 1770,
             },
         }
+
+        The response of the API is cached for 30 seconds. Use `refresh()` to clear the cache.
         """
-        result = self._get(f"/getPlantOverview?key={self.api_key}")
+        result = self._get(self._overview_url)
         return {
-            "last_updated": datetime.strptime(result["ludt"], "%Y-%m-%d %H:%M:%S"),
+            "last_updated": datetime.fromisoformat(result["ludt"]),
             "online": result["status"] == 1,
-            "power": self._apply_unit(**result["Power"]),
+            "power": _apply_unit(result["Power"]["value"], result["Power"]["unit"]),
             "site_id": result["sid"],
             "yield": {
-                "today": self._apply_unit(**result["E-Today"]),
-                "month": self._apply_unit(**result["E-Month"]),
-                "year": self._apply_unit(**result["E-Year"]),
-                "total": self._apply_unit(**result["E-Total"]),
+                key: _apply_unit(result[field]["value"], result[field]["unit"]) for key, field in _OVERVIEW_YIELDS
             },
         }
 
@@ -71,19 +211,20 @@ class ZeverCloud:
         Get a list of events -errors- that occurred between start_date and end_date.
 
         Note that the API can only return events for 7 days at a time. Using this method
-        on a large date range will result in many API-calls being made, and may hence
-        take a rather long time.
+        on a large date range will result in many API-calls being made. These are made
+        concurrently, but may still take a rather long time.
 
         Args:
             start_date (date): The start date (inclusive)
             end_date (date): The end date (inclusive)
         """
-        result = []
-        while (end_date - start_date).days > 6:
-            result += self._get_events(start_date, start_date + timedelta(days=6))
-            start_date = start_date + timedelta(days=7)
-        result += self._get_events(start_date, end_date)
-        return result
+        windows = self._event_windows(start_date, end_date)
+        if len(windows) == 1:  # No need to start a thread pool for a single request.
+            return self._get_events(*windows[0])
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(windows))) as executor:
+            # executor.map returns the results in order of submission.
+            chunks = executor.map(lambda dates: self._get_events(*dates), windows)
+            return list(chain.from_iterable(chunks))
 
     def get_output(self, date: date) -> List[Dict[str, Union[int, datetime]]]:
         """
@@ -103,76 +244,77 @@ class ZeverCloud:
         Args:
             date (date): The date for which to request the power data.
         """
-        response = self._get(f"/getPlantOutput?date={date.strftime('%Y-%m-%d')}&key={self.api_key}&period=bydays")
-        return [
-            dict(
-                timestamp=datetime.combine(
-                    date=date,
-                    time=time(hour=int(entry["time"][:2]), minute=int(entry["time"][-2:])),
-                ),
-                power=self._apply_unit(value=float(entry["value"]), unit=response["dataunit"]),
-            )
-            for entry in response["data"]
-        ]
+        return self._parse_output(date, self._get(self._output_url.format(_format_date(date), "bydays")))
+
+    def get_output_array(self, date: date) -> "np.ndarray":
+        """
+        Get the power output of the site at 20-minute intervals on the provided date, as a numpy array.
 
-    def get_details(self, date: date, psno: str) -> List[Dict[str, Union[datetime, int, float, str]]]:
+        Returns a structured array with the fields "timestamp" (datetime64[m]) and "power" (int64):
+        array([
+            ...
+            ('2022-08-01T12:00', 1183),
+            ('2022-08-01T12:20', 1240),
+            ('2022-08-01T12:40', 1815),
+            ...
+        ], dtype=[('timestamp', '<M8[m]'), ('power', '<i8')])
+
+        The unit of the power field is Watt. Should the API report a unit of yield instead, the values are
+        converted to kWh and the power field is float64, as in `get_output`. Requires numpy.
+
+        Args:
+            date (date): The date for which to request the power data.
+        """
+        if np is None:
+            raise ImportError("get_output_array requires numpy. Install zevercloud-api[numpy].")
+        response = self._get(self._output_url.format(_format_date(date), "bydays"))
+        multiplier, is_yield = _unit_scale(response["dataunit"])
+        data = response["data"]
+        dtype = [("timestamp", "datetime64[m]"), ("power", "float64" if is_yield else "int64")]
+        result = np.empty(len(data), dtype=dtype)
+        times = np.array([entry["time"] for entry in data], dtype=str)
+        result["timestamp"] = np.char.add(_format_date(date) + "T", times).astype("datetime64[m]")
+        values = np.array([entry["value"] for entry in data], dtype=str).astype(float)
+        # Same conversion as _unit_converter: yield to kWh, power to (rounded) W.
+        result["power"] = values * multiplier / 1000 if is_yield else np.rint(values * multiplier)
+        return result
+
+    def get_details(self, date: date, psno: str) -> List[ZeverSolarDetail]:
         """
         Get monitor details at 10-minutes on the provided date.
 
-        Returns a list of dictionaries of the form:
+        Returns a list of named tuples of the form:
         [
-           {
-            'ac_frequency': 50,
-            'ac_power': 30,
-            'ac_current_p1': 0,
-            'ac_current_p2': 0,
-            'ac_current_p3': 0,
-            'ac_voltage_p1': 236.8,
-            'ac_voltage_p2': 0,
-            'ac_voltage_p3': 0,
-            'inverter_id': 'ZS12345678',
-            'pv_current_1': 0,
-            'pv_current_2': 0,
-            'pv_current_3': 0,
-            'pv_voltage_1': 271.4,
-            'pv_voltage_2': 0,
-            'pv_voltage_3': 0,
-            'temperature': 26.7,
-            'timestamp': datetime.datetime(2022, 8, 1, 6, 49, 37),
-            'yield_today': 0.1,
-            'yield_total': 5615.2
-           }
+            ZeverSolarDetail(
+                ac_frequency=50,
+                ac_power=30,
+                ac_current_p1=0,
+                ac_current_p2=0,
+                ac_current_p3=0,
+                ac_voltage_p1=236.8,
+                ac_voltage_p2=0,
+                ac_voltage_p3=0,
+                inverter_id='ZS12345678',
+                pv_current_1=0,
+                pv_current_2=0,
+                pv_current_3=0,
+                pv_voltage_1=271.4,
+                pv_voltage_2=0,
+                pv_voltage_3=0,
+                temperature=26.7,
+                timestamp=datetime.datetime(2022, 8, 1, 6, 49, 37),
+                yield_today=0.1,
+                yield_total=5615.2,
+            )
         ]
 
+        Use `detail._asdict()` to convert an entry to a dictionary.
+
         Args:
             date (date): The date for which to request the data.
             psno (str): The ID of the monitor. E.g. EAB1234C5678.
         """
-        response = self._get(f"/getpmudata?apikey={self.api_key}&date={date.strftime('%Y-%m-%d')}&psno={psno}")
-        return [
-            dict(
-                ac_frequency=entry.get("fac"),
-                ac_power=entry.get("pac"),
-                ac_current_p1=entry.get("iac1"),
-                ac_current_p2=entry.get("iac2"),
-                ac_current_p3=entry.get("iac3"),
-                ac_voltage_p1=entry.get("vac1"),
-                ac_voltage_p2=entry.get("vac2"),
-                ac_voltage_p3=entry.get("vac3"),
-                inverter_id=entry.get("isno"),
-                pv_current_1=entry.get("ipv1"),
-                pv_current_2=entry.get("ipv2"),
-                pv_current_3=entry.get("ipv3"),
-                pv_voltage_1=entry.get("vpv1"),
-                pv_voltage_2=entry.get("vpv2"),
-                pv_voltage_3=entry.get("vpv3"),
-                temperature=entry.get("tempval"),
-                timestamp=datetime.strptime(entry["recvdate"], "%Y-%m-%d %H:%M:%S"),
-                yield_today=entry.get("e_today"),
-                yield_total=entry.get("e_total"),
-            )
-            for entry in response["data"]
-        ]
+        return self._parse_details(self._get(self._details_url.format(_format_date(date), psno)))
 
     def get_daily_output(self, month: date) -> List[Dict[str, Any]]:
         """
@@ -192,11 +334,13 @@ class ZeverCloud:
             month (date): The month for which to request yield data.
                 Accepts a datetime.date object, of which the day field is ignored.
         """
-        response = self._get(f"/getPlantOutput?date={month.strftime('%Y-%m')}&key={self.api_key}&period=bymonth")
+        response = self._get(self._output_url.format(f"{month.year:04d}-{month.month:02d}", "bymonth"))
+        convert = _unit_converter(response["dataunit"])
+        parse = date.fromisoformat
         return [
             {
-                "date": datetime.strptime(entry["time"], "%Y-%m-%d").date(),
-                "yield": self._apply_unit(value=float(entry["value"]), unit=response["dataunit"]),
+                "date": parse(entry["time"]),
+                "yield": convert(entry["value"]),
             }
             for entry in response["data"]
         ]
@@ -219,13 +363,15 @@ class ZeverCloud:
         Args:
             year (int): The year for which to request yield data.
         """
-        if not isinstance(year, int) or len(str(year)) != 4:
+        if not isinstance(year, int) or not 1000 <= year <= 9999:
             raise ValueError(f"Year must be a four-digit integer. Got {year}.")
-        response = self._get(f"/getPlantOutput?date={year}&key={self.api_key}&period=byyear")
+        response = self._get(self._output_url.format(year, "byyear"))
+        convert = _unit_converter(response["dataunit"])
+        parse = date.fromisoformat
         return [
             {
-                "date": datetime.strptime(entry["time"] + "-01", "%Y-%m-%d").date(),
-                "yield": self._apply_unit(value=float(entry["value"]), unit=response["dataunit"]),
+                "date": parse(entry["time"] + "-01"),
+                "yield": convert(entry["value"]),
             }
             for entry in response["data"]
         ]
@@ -242,33 +388,71 @@ class ZeverCloud:
         ]
 
         The unit of the yield field is kWh.
+
+        The response of the API is cached for an hour. Use `refresh()` to clear the cache.
         """
-        response = self._get(f"/getPlantOutput?key={self.api_key}&period=bytotal")
+        response = self._get(self._total_output_url)
+        convert = _unit_converter(response["dataunit"])
         return [
             {
                 "year": int(entry["time"]),
-                "yield": self._apply_unit(value=float(entry["value"]), unit=response["dataunit"]),
+                "yield": convert(entry["value"]),
             }
             for entry in response["data"]
         ]
 
+    async def aget_events(self, start_date: date, end_date: date) -> List[ZeverSolarEvent]:
+        """
+        Asynchronous version of `get_events`. Requires aiohttp.
+
+        All 7-day windows are requested concurrently, on a single event loop.
+        """
+        chunks = await gather(*(self._aget_events(*dates) for dates in self._event_windows(start_date, end_date)))
+        return list(chain.from_iterable(chunks))
+
+    async def aget_output(self, date: date) -> List[Dict[str, Union[int, datetime]]]:
+        """Asynchronous version of `get_output`. Requires aiohttp."""
+        return self._parse_output(date, await self._aget(self._output_url.format(_format_date(date), "bydays")))
+
+    async def aget_details(self, date: date, psno: str) -> List[ZeverSolarDetail]:
+        """Asynchronous version of `get_details`. Requires aiohttp."""
+        return self._parse_details(await self._aget(self._details_url.format(_format_date(date), psno)))
+
     def _get_events(self, start_date: date, end_date: date) -> List[ZeverSolarEvent]:
         """
         Get a list of events that occurred between start_date and end_date.
 
         The start and end date may not be more than six days apart.
         """
+        return self._parse_events(self._get(self._event_url(start_date, end_date)))
+
+    async def _aget_events(self, start_date: date, end_date: date) -> List[ZeverSolarEvent]:
+        """Asynchronous version of `_get_events`."""
+        return self._parse_events(await self._aget(self._event_url(start_date, end_date)))
+
+    @staticmethod
+    def _event_windows(start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """Split the range from start_date to end_date (inclusive) into windows of at most 7 days."""
+        windows = []
+        while (end_date - start_date).days > 6:
+            windows.append((start_date, start_date + _SIX_DAYS))
+            start_date += _WEEK
+        windows.append((start_date, end_date))
+        return windows
+
+    def _event_url(self, start_date: date, end_date: date) -> str:
         if (end_date - start_date).days > 6:
             raise ValueError("Can not request more than 7 days of events at once.")
-        result = self._get(
-            f"/getPlantEvent?edt={end_date.strftime('%Y-%m-%d')}"
-            f"&key={self.api_key}&sdt={start_date.strftime('%Y-%m-%d')}"
-        )
+        return self._events_url.format(_format_date(end_date), _format_date(start_date))
+
+    @staticmethod
+    def _parse_events(result: Dict[str, Any]) -> List[ZeverSolarEvent]:
         if result.get("code") == 0:
             return []  # No events in time range.
+        parse = datetime.fromisoformat
         return [
             ZeverSolarEvent(
-                event_time=datetime.strptime(entry["eventTime"], "%Y-%m-%d %H:%M:%S"),
+                event_time=parse(entry["eventTime"]),
                 event_type=int(entry["eventType"]),
                 event_code=int(entry["eventCode"]),
                 inverter_id=entry["ssno"],
@@ -276,61 +460,123 @@ class ZeverCloud:
             for entry in result["data"]
         ]
 
+    @staticmethod
+    def _parse_output(date: date, response: Dict[str, Any]) -> List[Dict[str, Union[int, datetime]]]:
+        convert = _unit_converter(response["dataunit"])
+        # Parsing "YYYY-MM-DDTHH:MM" in one fromisoformat call is faster than slicing the "HH:MM" time.
+        parse = datetime.fromisoformat
+        prefix = _format_date(date) + "T"
+        return [
+            {
+                "timestamp": parse(prefix + entry["time"]),
+                "power": convert(entry["value"]),
+            }
+            for entry in response["data"]
+        ]
+
+    @staticmethod
+    def _parse_details(response: Dict[str, Any]) -> List[ZeverSolarDetail]:
+        parse = datetime.fromisoformat
+        return [
+            ZeverSolarDetail(
+                ac_frequency=entry.get("fac"),
+                ac_power=entry.get("pac"),
+                ac_current_p1=entry.get("iac1"),
+                ac_current_p2=entry.get("iac2"),
+                ac_current_p3=entry.get("iac3"),
+                ac_voltage_p1=entry.get("vac1"),
+                ac_voltage_p2=entry.get("vac2"),
+                ac_voltage_p3=entry.get("vac3"),
+                inverter_id=entry.get("isno"),
+                pv_current_1=entry.get("ipv1"),
+                pv_current_2=entry.get("ipv2"),
+                pv_current_3=entry.get("ipv3"),
+                pv_voltage_1=entry.get("vpv1"),
+                pv_voltage_2=entry.get("vpv2"),
+                pv_voltage_3=entry.get("vpv3"),
+                temperature=entry.get("tempval"),
+                timestamp=parse(entry["recvdate"]),
+                yield_today=entry.get("e_today"),
+                yield_total=entry.get("e_total"),
+            )
+            for entry in response["data"]
+        ]
+
     def _get(self, url: str) -> Dict[str, Any]:
+        """Get the response for the given url, from the cache if the url is cached (see _cache_ttl)."""
+        ttl = self._cache_ttl.get(url)
+        if ttl is None:
+            return self._do_get(url)
+        now = monotonic()
+        hit = self._cache.get(url)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        result = self._do_get(url)
+        self._cache[url] = (now + ttl, result)
+        return result
+
+    def _do_get(self, url: str) -> Dict[str, Any]:
         # TODO: rate limiting
-        headers_to_sign = {
-            "X-Ca-Key": self.app_key,
-            "X-Ca-Nonce": str(uuid4()),
-            "X-Ca-Timestamp": str(int(timestamp() * 1000)),
-        }
-        headers_string = "".join([f"{key}:{headers_to_sign[key]}\n" for key in sorted(headers_to_sign.keys())])
-        payload = f"GET\napplication/json\n\n\n\n{headers_string}{url}"
-        signature = hmac(
-            key=self.app_secret.encode("UTF-8"),
-            digestmod=sha256,
-            msg=payload.encode("UTF-8"),
-        ).digest()
-        headers = {
-            "X-Ca-Signature-Headers": ",".join(headers_to_sign.keys()),
-            "X-Ca-Signature": b64encode(signature).decode("UTF-8"),
-            "Accept": "application/json",
-            **headers_to_sign,
-        }
-        response = get(f"http://api.general.zevercloud.cn{url}", headers=headers)
-        if response.status_code == 400:
-            # TODO: error handling
-            print(response.headers)
-        response.raise_for_status()
-        return response.json()
+        headers = self._sign(url)
+        response = self._pool.request("GET", url, headers=headers)
+        self._check_status(url, response.status, response.headers)
+        return loads(response.data)
 
-    @staticmethod
-    def _apply_unit(value: float, unit: str) -> Union[float, int]:
+    async def _aget(self, url: str) -> Dict[str, Any]:
         """
-        Given a unit and a value, convert the value to a standardized unit.
+        Asynchronous version of `_do_get`, using aiohttp. Responses are not cached.
 
-        Values are converted to:
-        - W (Watt) for power (i.e. the incoming unit is W, kW, MW)
-        - kWh (kiloWatt-hour) for yield (i.e. the incoming unit is Wh, kWh, MWh)
+        Within `async with`, the session of the client is used. Otherwise the request gets a session of its own,
+        so that no session is left behind in an event loop that is closed afterwards (e.g. by asyncio.run).
+        """
+        context = self._new_session() if self._asession is None else nullcontext(self._asession)
+        async with context as session, session.get(url, headers=self._sign(url)) as response:
+            self._check_status(url, response.status, response.headers)
+            return loads(await response.read())
+
+    def _new_session(self) -> "aiohttp.ClientSession":
+        if aiohttp is None:
+            raise ImportError("The asynchronous methods require aiohttp. Install zevercloud-api[aiohttp].")
+        return aiohttp.ClientSession(
+            self._base_url,
+            connector=aiohttp.TCPConnector(limit=_MAX_WORKERS),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
 
-        As the Zevercloud API (sometimes) uses incorrect capitalisation (KWh instead of kWh),
-        capitalisation is ignored.
+    @staticmethod
+    def _check_status(url: str, status: int, headers: Mapping[str, str]) -> None:
+        """Log the status of a response to the given url, and raise a ZeverCloudError if it is an error."""
+        # The query is left out, as it contains the api key.
+        logger.debug("GET %s returned status %s", url.partition("?")[0], status)
+        if status >= 400:
+            raise ZeverCloudError(status=status, url=url, message=headers.get("X-Ca-Error-Message"))
+
+    def _sign(self, url: str) -> Dict[str, str]:
         """
-        unit = unit.lower()
-        if unit.startswith("w"):
-            result = value
-        elif unit.startswith("k"):
-            result = 1000 * value
-        elif unit.startswith("m"):
-            result = 1_000_000 * value
-        else:
-            raise ValueError(f"Unrecognized unit: {unit}")
-        if unit.endswith("h"):  # We convert yield to kWh
-            return result / 1000
-        else:
-            return int(round(result))
+        Build the signed headers for a GET request to the given url.
+
+        The signed headers (X-Ca-Key, X-Ca-Nonce and X-Ca-Timestamp) are already in sorted order.
+        """
+        nonce = str(uuid4())
+        ca_timestamp = str(int(timestamp() * 1000))
+        signer = self._hmac.copy()
+        signer.update(
+            self._payload_prefix + f"X-Ca-Nonce:{nonce}\nX-Ca-Timestamp:{ca_timestamp}\n{url}".encode("UTF-8")
+        )
+        headers_to_sign = {"X-Ca-Key": self.app_key, "X-Ca-Nonce": nonce, "X-Ca-Timestamp": ca_timestamp}
+        return {
+            "X-Ca-Signature-Headers": ",".join(headers_to_sign.keys()),
+            "X-Ca-Signature": b64encode(signer.digest()).decode("UTF-8"),
+            "Accept": "application/json",
+            **headers_to_sign,
+        }
 
     @property
     def inverters(self) -> List[str]:
-        """Get a list of inverter ids associated to your site."""
-        result = self._get(f"/getInverterOverview?key={self.api_key}")
+        """
+        Get a list of inverter ids associated to your site.
+
+        The response of the API is cached for 30 seconds. Use `refresh()` to clear the cache.
+        """
+        result = self._get(self._inverters_url)
         return [entry["isno"] for entry in result["data"]]
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class ZeverSolarDetail(NamedTuple):
+    ac_frequency: Optional[float]
+    ac_power: Optional[float]
+    ac_current_p1: Optional[float]
+    ac_current_p2: Optional[float]
+    ac_current_p3: Optional[float]
+    ac_voltage_p1: Optional[float]
+    ac_voltage_p2: Optional[float]
+    ac_voltage_p3: Optional[float]
+    inverter_id: Optional[str]
+    pv_current_1: Optional[float]
+    pv_current_2: Optional[float]
+    pv_current_3: Optional[float]
+    pv_voltage_1: Optional[float]
+    pv_voltage_2: Optional[float]
+    pv_voltage_3: Optional[float]
+    temperature: Optional[float]
+    timestamp: datetime
+    yield_today: Optional[float]
+    yield_total: Optional[float]
@@ -48,7 +48,7 @@ EVENT_DESCRIPTIONS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ZeverSolarEvent:
     event_time: datetime
     inverter_id: str
@@ -0,0 +1,12 @@
+from typing import Optional
+
+
+class ZeverCloudError(Exception):
+    """Raised when the ZeverCloud API responds with an error status."""
+
+    def __init__(self, status: int, url: str, message: Optional[str] = None):
+        self.status = status
+        # The query is left out, as it contains the api key.
+        self.url = url.partition("?")[0]
+        self.message = message
+        super().__init__(f"{status} error for url {self.url}" + (f": {message}" if message else ""))
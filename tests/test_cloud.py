@@ -1,28 +1,42 @@
+from asyncio import get_running_loop, run
+from base64 import b64encode
 from datetime import date, datetime
-from typing import Dict, Any
+from hashlib import sha256
+from hmac import new as hmac
+from json import dumps
+from logging import DEBUG
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
 
-from pytest import approx, fixture, mark
+from pytest import approx, fixture, importorskip, mark, param, raises
 
-from zevercloud import ZeverCloud
+from zevercloud import ZeverCloud, ZeverCloudError
+from zevercloud.cloud import _apply_unit
+from zevercloud.detail import ZeverSolarDetail
 from zevercloud.event import ZeverSolarEvent
 
 
 class MockedZeverCloud(ZeverCloud):
-    def __init__(self, result):
-        super().__init__("x", "y", "z")
+    def __init__(self, result, api_key: str = "x"):
+        super().__init__(api_key, "y", "z")
         self.urls = []
+        self._urls_append = self.urls.append
         self.result = result
 
-    def _get(self, url: str) -> Dict[str, Any]:
-        self.urls.append(url)
+    @classmethod
+    def with_result(cls, result: Dict[str, Any], api_key: str = "x") -> "MockedZeverCloud":
+        return cls(result, api_key=api_key)
+
+    def _do_get(self, url: str) -> Dict[str, Any]:
+        self._urls_append(url)
         return self.result
 
 
 class TestProperties:
     @fixture()
     def mocked_cloud(self) -> MockedZeverCloud:
-        return MockedZeverCloud(
-            result={
+        return MockedZeverCloud.with_result(
+            {
                 "sid": 12345,
                 "ludt": "2022-02-03 13:57:26",
                 "status": "0",
@@ -50,91 +64,212 @@ class TestProperties:
             },
         }
 
+    def test_overview_cached(self, mocked_cloud):
+        assert mocked_cloud.overview == mocked_cloud.overview
+        assert mocked_cloud.urls == ["/getPlantOverview?key=x"]
+        mocked_cloud.refresh()
+        mocked_cloud.overview
+        assert len(mocked_cloud.urls) == 2
+
+
+@fixture(scope="session")
+def make_cloud() -> Callable[[Dict[str, Any]], MockedZeverCloud]:
+    def _make_cloud(result: Dict[str, Any]) -> MockedZeverCloud:
+        return MockedZeverCloud.with_result(result)
+
+    return _make_cloud
+
+
+OUTPUT_RESULT = {
+    "sid": 893,
+    "dataunit": "KW",
+    "data": [
+        {"time": "00:00", "no": "0", "value": "0.0"},
+        {"time": "00:20", "no": "2", "value": "1.1"},
+        {"time": "00:40", "no": "4", "value": "2.2"},
+    ],
+}
+
 
 class TestGetOutput:
-    def test_output(self):
-        cloud = MockedZeverCloud(
-            {
-                "sid": 893,
-                "dataunit": "KW",
-                "data": [
-                    {"time": "00:00", "no": "0", "value": "0.0"},
-                    {"time": "00:20", "no": "2", "value": "1.1"},
-                    {"time": "00:40", "no": "4", "value": "2.2"},
+    @mark.parametrize(
+        "method, kwargs, result, expected, url",
+        [
+            param(
+                "get_output",
+                dict(date=date(2022, 1, 1)),
+                OUTPUT_RESULT,
+                [
+                    {"power": 0, "timestamp": datetime(2022, 1, 1, 0, 0)},
+                    {"power": 1100, "timestamp": datetime(2022, 1, 1, 0, 20)},
+                    {"power": 2200, "timestamp": datetime(2022, 1, 1, 0, 40)},
                 ],
-            }
-        )
-        assert cloud.get_output(date=date(2022, 1, 1)) == [
-            {"power": 0, "timestamp": datetime(2022, 1, 1, 0, 0)},
-            {"power": 1100, "timestamp": datetime(2022, 1, 1, 0, 20)},
-            {"power": 2200, "timestamp": datetime(2022, 1, 1, 0, 40)},
+                "/getPlantOutput?date=2022-01-01&key=x&period=bydays",
+                id="output",
+            ),
+            param(
+                "get_daily_output",
+                dict(month=date(2014, 4, 15)),
+                {
+                    "dataunit": "KWh",
+                    "sid": "36",
+                    "data": [
+                        {"time": "2014-04-01", "no": "1", "value": "4.1"},
+                        {"time": "2014-04-02", "no": "2", "value": "5.2"},
+                        {"time": "2014-04-03", "no": "3", "value": "0.2"},
+                    ],
+                },
+                [
+                    {"date": date(2014, 4, 1), "yield": 4.1},
+                    {"date": date(2014, 4, 2), "yield": 5.2},
+                    {"date": date(2014, 4, 3), "yield": 0.2},
+                ],
+                "/getPlantOutput?date=2014-04&key=x&period=bymonth",
+                id="daily",
+            ),
+            param(
+                "get_monthly_output",
+                dict(year=2014),
+                {
+                    "dataunit": "KWh",
+                    "sid": "36",
+                    "data": [
+                        {"time": "2014-01", "no": "1", "value": "40.1"},
+                        {"time": "2014-02", "no": "2", "value": "52.1"},
+                        {"time": "2014-03", "no": "3", "value": "113"},
+                        {"time": "2014-04", "no": "4", "value": "8.11"},
+                    ],
+                },
+                [
+                    {"date": date(2014, 1, 1), "yield": 40.1},
+                    {"date": date(2014, 2, 1), "yield": 52.1},
+                    {"date": date(2014, 3, 1), "yield": 113},
+                    {"date": date(2014, 4, 1), "yield": 8.11},
+                ],
+                "/getPlantOutput?date=2014&key=x&period=byyear",
+                id="monthly",
+            ),
+            param(
+                "get_yearly_output",
+                dict(),
+                {
+                    "dataunit": "MWh",
+                    "sid": "36",
+                    "data": [
+                        {"time": "2012", "no": "1", "value": "4.069"},
+                        {"time": "2013", "no": "2", "value": "0.308"},
+                    ],
+                },
+                [
+                    {"year": 2012, "yield": 4069},
+                    {"year": 2013, "yield": 308},
+                ],
+                "/getPlantOutput?key=x&period=bytotal",
+                id="yearly",
+            ),
+        ],
+    )
+    def test_output(self, make_cloud, method, kwargs, result, expected, url):
+        cloud = make_cloud(result)
+        assert getattr(cloud, method)(**kwargs) == expected
+        assert cloud.urls == [url]
+
+    @mark.parametrize(
+        "time, expected", [("00:00", (0, 0)), ("09:40", (9, 40)), ("12:20", (12, 20)), ("23:40", (23, 40))]
+    )
+    def test_output_time(self, make_cloud, time, expected):
+        cloud = make_cloud({"sid": 893, "dataunit": "W", "data": [{"time": time, "no": "0", "value": "1"}]})
+        (entry,) = cloud.get_output(date=date(2022, 8, 1))
+        assert entry["timestamp"] == datetime(2022, 8, 1, *expected)
+
+    def test_output_api_key_braces(self):
+        cloud = MockedZeverCloud.with_result({"sid": 893, "dataunit": "KW", "data": []}, api_key="a{b}")
+        cloud.get_output(date=date(2022, 1, 1))
+        cloud.get_details(date=date(2022, 1, 1), psno="EAB1234C5678")
+        cloud.get_events(date(2022, 1, 1), date(2022, 1, 3))
+        assert cloud.urls == [
+            "/getPlantOutput?date=2022-01-01&key=a{b}&period=bydays",
+            "/getpmudata?apikey=a{b}&date=2022-01-01&psno=EAB1234C5678",
+            "/getPlantEvent?edt=2022-01-03&key=a{b}&sdt=2022-01-01",
         ]
+
+    def test_output_datetime(self, make_cloud):
+        cloud = make_cloud({"sid": 893, "dataunit": "KW", "data": []})
+        assert cloud.get_output(date=datetime(2022, 1, 1, 12, 30)) == []
         assert cloud.urls == ["/getPlantOutput?date=2022-01-01&key=x&period=bydays"]
 
-    def test_daily_output(self):
-        cloud = MockedZeverCloud(
-            {
-                "dataunit": "KWh",
-                "sid": "36",
-                "data": [
-                    {"time": "2014-04-01", "no": "1", "value": "4.1"},
-                    {"time": "2014-04-02", "no": "2", "value": "5.2"},
-                    {"time": "2014-04-03", "no": "3", "value": "0.2"},
-                ],
-            }
-        )
-        assert cloud.get_daily_output(month=date(2014, 4, 15)) == [
-            {"date": date(2014, 4, 1), "yield": 4.1},
-            {"date": date(2014, 4, 2), "yield": 5.2},
-            {"date": date(2014, 4, 3), "yield": 0.2},
+    def test_output_array(self, make_cloud):
+        np = importorskip("numpy")
+        cloud = make_cloud(OUTPUT_RESULT)
+        result = cloud.get_output_array(date=date(2022, 1, 1))
+        assert result["timestamp"].tolist() == [
+            datetime(2022, 1, 1, 0, 0),
+            datetime(2022, 1, 1, 0, 20),
+            datetime(2022, 1, 1, 0, 40),
         ]
-        assert cloud.urls == ["/getPlantOutput?date=2014-04&key=x&period=bymonth"]
+        assert result["power"].tolist() == [0, 1100, 2200]
+        assert result["power"].dtype == np.int64
+        assert cloud.urls == ["/getPlantOutput?date=2022-01-01&key=x&period=bydays"]
 
-    def test_monthly_output(self):
-        cloud = MockedZeverCloud(
-            {
-                "dataunit": "KWh",
-                "sid": "36",
-                "data": [
-                    {"time": "2014-01", "no": "1", "value": "40.1"},
-                    {"time": "2014-02", "no": "2", "value": "52.1"},
-                    {"time": "2014-03", "no": "3", "value": "113"},
-                    {"time": "2014-04", "no": "4", "value": "8.11"},
-                ],
-            }
-        )
-        assert cloud.get_monthly_output(year=2014) == [
-            {"date": date(2014, 1, 1), "yield": 40.1},
-            {"date": date(2014, 2, 1), "yield": 52.1},
-            {"date": date(2014, 3, 1), "yield": 113},
-            {"date": date(2014, 4, 1), "yield": 8.11},
-        ]
-        assert cloud.urls == ["/getPlantOutput?date=2014&key=x&period=byyear"]
+    @mark.parametrize("unit, value, expected", [("KWh", "1.25", 1.25), ("Wh", "800", 0.8), ("MWh", "1.2", 1200)])
+    def test_output_array_yield(self, make_cloud, unit, value, expected):
+        np = importorskip("numpy")
+        cloud = make_cloud({"sid": 893, "dataunit": unit, "data": [{"time": "00:20", "no": "2", "value": value}]})
+        result = cloud.get_output_array(date=date(2022, 1, 1))
+        assert result["power"].dtype == np.float64
+        assert result["power"].tolist() == approx([expected])
+        assert result["power"].tolist() == approx([entry["power"] for entry in cloud.get_output(date(2022, 1, 1))])
+
+    @mark.parametrize("year", [999, 10000, -123, "2014", 2014.0])
+    def test_monthly_output_invalid_year(self, make_cloud, year):
+        with raises(ValueError, match="four-digit integer"):
+            make_cloud({}).get_monthly_output(year=year)
 
-    def test_yearly_output(self):
-        cloud = MockedZeverCloud(
+    def test_yearly_output_cached(self, make_cloud):
+        cloud = make_cloud({"dataunit": "MWh", "sid": "36", "data": []})
+        cloud.get_yearly_output()
+        cloud.get_yearly_output()
+        assert cloud.urls == ["/getPlantOutput?key=x&period=bytotal"]
+
+
+class TestGetDetails:
+    def test_details(self):
+        cloud = MockedZeverCloud.with_result(
             {
-                "dataunit": "MWh",
-                "sid": "36",
-                "data": [{"time": "2012", "no": "1", "value": "4.069"}, {"time": "2013", "no": "2", "value": "0.308"}],
+                "data": [
+                    {
+                        "fac": 50,
+                        "pac": 30,
+                        "iac1": 0,
+                        "vac1": 236.8,
+                        "isno": "ZS12345678",
+                        "vpv1": 271.4,
+                        "tempval": 26.7,
+                        "recvdate": "2022-08-01 06:49:37",
+                        "e_today": 0.1,
+                        "e_total": 5615.2,
+                    }
+                ]
             }
         )
-        assert cloud.get_yearly_output() == [
-            {"year": 2012, "yield": 4069},
-            {"year": 2013, "yield": 308},
-        ]
-        assert cloud.urls == ["/getPlantOutput?key=x&period=bytotal"]
+        (detail,) = cloud.get_details(date=date(2022, 8, 1), psno="EAB1234C5678")
+        assert isinstance(detail, ZeverSolarDetail)
+        assert detail.ac_power == 30
+        assert detail.ac_voltage_p2 is None
+        assert detail.timestamp == datetime(2022, 8, 1, 6, 49, 37)
+        assert detail._asdict()["yield_total"] == 5615.2
+        assert cloud.urls == ["/getpmudata?apikey=x&date=2022-08-01&psno=EAB1234C5678"]
 
 
 class TestGetEvents:
     def test_url(self):
-        cloud = MockedZeverCloud(dict(code=0))
+        cloud = MockedZeverCloud.with_result(dict(code=0))
         events = cloud.get_events(date(2022, 1, 1), date(2022, 1, 3))
         assert events == []
         assert cloud.urls == ["/getPlantEvent?edt=2022-01-03&key=x&sdt=2022-01-01"]
 
     def test_result(self):
-        cloud = MockedZeverCloud(
+        cloud = MockedZeverCloud.with_result(
             dict(data=[dict(eventType=101, eventCode=3, ssno="ZS12345678", eventTime="2022-01-01 12:34:56")])
         )
         events = cloud.get_events(date(2022, 1, 1), date(2022, 1, 3))
@@ -145,9 +280,10 @@ class TestGetEvents:
         ]
 
     def test_multiple_urls(self):
-        cloud = MockedZeverCloud(dict(code=0))
+        cloud = MockedZeverCloud.with_result(dict(code=0))
         cloud.get_events(date(2022, 1, 1), date(2022, 2, 3))
-        assert cloud.urls == [
+        # The windows are requested concurrently, so the order of the requests is not fixed.
+        assert sorted(cloud.urls) == [
             "/getPlantEvent?edt=2022-01-07&key=x&sdt=2022-01-01",
             "/getPlantEvent?edt=2022-01-14&key=x&sdt=2022-01-08",
             "/getPlantEvent?edt=2022-01-21&key=x&sdt=2022-01-15",
@@ -155,18 +291,247 @@ class TestGetEvents:
             "/getPlantEvent?edt=2022-02-03&key=x&sdt=2022-01-29",
         ]
 
+    def test_multiple_results(self):
+        class WindowedZeverCloud(MockedZeverCloud):
+            def _do_get(self, url: str) -> Dict[str, Any]:
+                super()._do_get(url)
+                start_date = url[-10:]  # Each window returns a single event on its start date.
+                return dict(data=[dict(eventType=1, eventCode=3, ssno="ZS1", eventTime=f"{start_date} 12:00:00")])
+
+        events = WindowedZeverCloud.with_result(None).get_events(date(2022, 1, 1), date(2022, 2, 3))
+        assert [event.event_time for event in events] == [
+            datetime(2022, 1, 1, 12),
+            datetime(2022, 1, 8, 12),
+            datetime(2022, 1, 15, 12),
+            datetime(2022, 1, 22, 12),
+            datetime(2022, 1, 29, 12),
+        ]
+
+
+class MockedResponse:
+    def __init__(self, status: int, data: bytes, headers: Dict[str, str]):
+        self.status, self.data, self.headers = status, data, headers
+
+    async def __aenter__(self) -> "MockedResponse":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def read(self) -> bytes:
+        return self.data
+
+
+class MockedSession:
+    def __init__(self, base_url: str, response: MockedResponse):
+        self.base_url = base_url
+        self.loop = get_running_loop()
+        self.closed = False
+        self.requests = []
+        self.response = response
+
+    def get(self, url: str, headers: Dict[str, str]) -> MockedResponse:
+        # Like aiohttp, a session can not be used outside of the event loop it was created in.
+        if self.closed or self.loop is not get_running_loop():
+            raise RuntimeError("Event loop is closed")
+        self.requests.append((url, headers))
+        return self.response
+
+    async def __aenter__(self) -> "MockedSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class MockedAiohttp:
+    def __init__(self, status: int, data: bytes, headers: Dict[str, str]):
+        self.response = MockedResponse(status, data, headers)
+        self.sessions = []
+
+    def ClientSession(self, base_url: str, connector: Any, timeout: Any) -> MockedSession:
+        session = MockedSession(base_url, self.response)
+        self.sessions.append(session)
+        return session
+
+    def TCPConnector(self, limit: int) -> SimpleNamespace:
+        return SimpleNamespace(limit=limit)
+
+    def ClientTimeout(self, total: int) -> SimpleNamespace:
+        return SimpleNamespace(total=total)
+
+
+class TestAsync:
+    @fixture
+    def mocked_aiohttp(self, monkeypatch) -> Callable[..., MockedAiohttp]:
+        def _mocked_aiohttp(data: Dict[str, Any], status: int = 200, headers: Dict[str, str] = {}) -> MockedAiohttp:
+            mocked = MockedAiohttp(status, dumps(data).encode("UTF-8"), headers)
+            monkeypatch.setattr("zevercloud.cloud.aiohttp", mocked)
+            return mocked
+
+        return _mocked_aiohttp
+
+    def test_events(self, mocked_aiohttp):
+        aiohttp = mocked_aiohttp(
+            dict(data=[dict(eventType=101, eventCode=3, ssno="ZS12345678", eventTime="2022-01-01 12:34:56")])
+        )
+        events = run(ZeverCloud("x", "y", "z").aget_events(date(2022, 1, 1), date(2022, 1, 10)))
+        assert len(events) == 2
+        assert sorted(url for session in aiohttp.sessions for url, _ in session.requests) == [
+            "/getPlantEvent?edt=2022-01-07&key=x&sdt=2022-01-01",
+            "/getPlantEvent?edt=2022-01-10&key=x&sdt=2022-01-08",
+        ]
+
+    def test_output(self, mocked_aiohttp):
+        result = {"sid": 893, "dataunit": "KW", "data": [{"time": "00:20", "no": "2", "value": "1.1"}]}
+        mocked_aiohttp(result)
+        expected = MockedZeverCloud.with_result(result).get_output(date=date(2022, 1, 1))
+        assert run(ZeverCloud("x", "y", "z").aget_output(date=date(2022, 1, 1))) == expected
+
+    def test_details(self, mocked_aiohttp):
+        aiohttp = mocked_aiohttp({"data": [{"pac": 30, "recvdate": "2022-08-01 06:49:37"}]})
+        (detail,) = run(ZeverCloud("x", "y", "z").aget_details(date=date(2022, 8, 1), psno="EAB1234C5678"))
+        assert detail.ac_power == 30
+        ((url, _),) = aiohttp.sessions[0].requests
+        assert url == "/getpmudata?apikey=x&date=2022-08-01&psno=EAB1234C5678"
+
+    @mark.parametrize("https, scheme", [(False, "http"), (True, "https")])
+    def test_session(self, mocked_aiohttp, https, scheme):
+        aiohttp = mocked_aiohttp({"data": []})
+        run(ZeverCloud("x", "y", "z", https=https).aget_details(date=date(2022, 8, 1), psno="EAB1234C5678"))
+        assert aiohttp.sessions[0].base_url == f"{scheme}://api.general.zevercloud.cn"
+
+    def test_headers(self, mocked_aiohttp):
+        aiohttp = mocked_aiohttp({"data": []})
+        run(ZeverCloud("x", "y", "z").aget_details(date=date(2022, 8, 1), psno="EAB1234C5678"))
+        ((url, headers),) = aiohttp.sessions[0].requests
+        assert headers["X-Ca-Key"] == "y"
+        payload = (
+            "GET\napplication/json\n\n\n\n"
+            f"X-Ca-Key:y\nX-Ca-Nonce:{headers['X-Ca-Nonce']}\nX-Ca-Timestamp:{headers['X-Ca-Timestamp']}\n{url}"
+        )
+        expected = hmac(key=b"z", msg=payload.encode("UTF-8"), digestmod=sha256).digest()
+        assert headers["X-Ca-Signature"] == b64encode(expected).decode("UTF-8")
+
+    def test_error(self, mocked_aiohttp):
+        mocked_aiohttp({}, status=400, headers={"X-Ca-Error-Message": "Invalid Signature"})
+        with raises(ZeverCloudError, match="Invalid Signature") as error:
+            run(ZeverCloud("x", "y", "z").aget_output(date=date(2022, 1, 1)))
+        assert error.value.status == 400
+
+    def test_run_twice(self, mocked_aiohttp):
+        aiohttp = mocked_aiohttp({"data": []})
+        cloud = ZeverCloud("x", "y", "z")
+        for _ in range(2):
+            assert run(cloud.aget_details(date=date(2022, 8, 1), psno="EAB1234C5678")) == []
+        assert len(aiohttp.sessions) == 2
+        assert [session for session in aiohttp.sessions if not session.closed] == []
+
+    def test_context_manager(self, mocked_aiohttp):
+        aiohttp = mocked_aiohttp({"data": []})
+        cloud = ZeverCloud("x", "y", "z")
+
+        async def get_twice():
+            async with cloud:
+                await cloud.aget_details(date=date(2022, 8, 1), psno="EAB1234C5678")
+                await cloud.aget_details(date=date(2022, 8, 2), psno="EAB1234C5678")
+
+        for _ in range(2):
+            run(get_twice())
+        assert [len(session.requests) for session in aiohttp.sessions] == [2, 2]
+        assert [session for session in aiohttp.sessions if not session.closed] == []
+        assert cloud._asession is None
+
+    def test_aclose(self, mocked_aiohttp):
+        mocked_aiohttp({"data": []})
+        run(ZeverCloud("x", "y", "z").aclose())
+
+    def test_requires_aiohttp(self, monkeypatch):
+        monkeypatch.setattr("zevercloud.cloud.aiohttp", None)
+        with raises(ImportError, match="aiohttp"):
+            run(ZeverCloud("x", "y", "z").aget_output(date=date(2022, 1, 1)))
+
 
 class TestApplyUnit:
     @mark.parametrize(
         "value, unit, expected", [(5.9, "KW", 5900), (1.2, "MW", 1_200_000), (4.01, "kW", 4010), (8, "W", 8)]
     )
     def test_power(self, value, unit, expected):
-        result = ZeverCloud._apply_unit(value, unit)
+        result = _apply_unit(value, unit)
         assert result == approx(expected)
         assert isinstance(result, int)
 
     @mark.parametrize("value, unit, expected", [(5.9, "KWh", 5.9), (1.2, "MWh", 1200), (800, "Wh", 0.8)])
     def test_yield(self, value, unit, expected):
-        result = ZeverCloud._apply_unit(value, unit)
+        result = _apply_unit(value, unit)
         assert result == approx(expected)
         assert isinstance(result, float)
+
+    @mark.parametrize("unit", ["", "T", "€"])
+    def test_unrecognized(self, unit):
+        with raises(ValueError, match="Unrecognized unit"):
+            _apply_unit(1.0, unit)
+
+
+class TestSign:
+    def test_signature(self):
+        cloud = ZeverCloud("x", "y", "z")
+        headers = cloud._sign("/getPlantOverview?key=x")
+        payload = (
+            "GET\napplication/json\n\n\n\n"
+            f"X-Ca-Key:y\nX-Ca-Nonce:{headers['X-Ca-Nonce']}\nX-Ca-Timestamp:{headers['X-Ca-Timestamp']}\n"
+            "/getPlantOverview?key=x"
+        )
+        expected = hmac(key=b"z", msg=payload.encode("UTF-8"), digestmod=sha256).digest()
+        assert headers["X-Ca-Signature"] == b64encode(expected).decode("UTF-8")
+        assert headers["X-Ca-Signature-Headers"] == "X-Ca-Key,X-Ca-Nonce,X-Ca-Timestamp"
+        assert headers["X-Ca-Key"] == "y"
+
+
+class MockedPool:
+    def __init__(self, status: int, data: bytes, headers: Dict[str, str]):
+        self.requests = []
+        self.response = SimpleNamespace(status=status, data=data, headers=headers)
+
+    def request(self, method: str, url: str, headers: Dict[str, str]):
+        self.requests.append((method, url, headers))
+        return self.response
+
+
+class TestGet:
+    def test_get(self):
+        cloud = ZeverCloud("x", "y", "z")
+        cloud._pool = MockedPool(status=200, data=b'{"sid": 12345}', headers={})
+        assert cloud._get("/getPlantOverview?key=x") == {"sid": 12345}
+        ((method, url, headers),) = cloud._pool.requests
+        assert (method, url) == ("GET", "/getPlantOverview?key=x")
+        assert headers["X-Ca-Key"] == "y"
+
+    @mark.parametrize("https, scheme", [(False, "http"), (True, "https")])
+    def test_scheme(self, https, scheme):
+        assert ZeverCloud("x", "y", "z", https=https)._pool.scheme == scheme
+
+    def test_debug_log(self, caplog):
+        cloud = ZeverCloud("x", "y", "z")
+        cloud._pool = MockedPool(status=200, data=b"{}", headers={})
+        with caplog.at_level(DEBUG, logger="zevercloud.cloud"):
+            cloud._get("/getPlantOverview?key=x")
+        assert caplog.messages == ["GET /getPlantOverview returned status 200"]
+
+    def test_error(self):
+        cloud = ZeverCloud("x", "y", "z")
+        cloud._pool = MockedPool(status=400, data=b"", headers={"X-Ca-Error-Message": "Invalid Signature"})
+        with raises(ZeverCloudError, match="Invalid Signature") as error:
+            cloud._get("/getPlantOverview?key=x")
+        assert error.value.status == 400
+
+    def test_error_hides_api_key(self):
+        cloud = ZeverCloud("SECRET", "y", "z")
+        cloud._pool = MockedPool(status=400, data=b"", headers={"X-Ca-Error-Message": "Invalid Signature"})
+        with raises(ZeverCloudError) as error:
+            cloud.get_output(date=date(2022, 1, 1))
+        assert str(error.value) == "400 error for url /getPlantOutput: Invalid Signature"
+        assert error.value.url == "/getPlantOutput"
@@ -1,4 +1,6 @@
+from dataclasses import asdict
 from datetime import datetime
+from pickle import dumps, loads
 
 from zevercloud.event import ZeverSolarEvent
 
@@ -6,3 +8,14 @@ from zevercloud.event import ZeverSolarEvent
 def test_description():
     event = ZeverSolarEvent(event_time=datetime.now(), inverter_id="ZX1234", event_code=110, event_type=3)
     assert event.event_description == "Device Fault"
+
+
+def test_hashable():
+    event = ZeverSolarEvent(event_time=datetime.now(), inverter_id="ZX1234", event_code=110, event_type=3)
+    assert len({event, ZeverSolarEvent(**asdict(event))}) == 1
+    assert not hasattr(event, "__dict__")
+
+
+def test_pickle():
+    event = ZeverSolarEvent(event_time=datetime.now(), inverter_id="ZX1234", event_code=110, event_type=3)
+    assert loads(dumps(event)) == event